@@ -8,6 +8,8 @@ from pathlib import Path
 class DataProcessor:
     """A class for processing various data formats."""
     
+    __slots__ = ("config_path", "data", "processed_count")
+    
     def __init__(self, config_path: str):
         self.config_path = config_path
         self.data = {}
@@ -15,29 +17,26 @@ class DataProcessor:
     
     def load_config(self) -> Dict:
         """Load configuration from file."""
-        if not os.path.exists(self.config_path):
+        try:
+            f = open(self.config_path, 'r')
+        except FileNotFoundError:
             logging.error(f"Config file not found: {self.config_path}")
-            raise FileNotFoundError(f"Config file not found: {self.config_path}")
+            raise FileNotFoundError(f"Config file not found: {self.config_path}") from None
         
-        with open(self.config_path, 'r') as f:
+        with f:
             # Use json.load instead of eval for security
             return json.load(f)
     
     def process_data(self, items: List[str]) -> List[str]:
         """Process a list of data items."""
-        results = []
-        for item in items:
-            if item.strip():
-                processed = item.upper().strip()
-                results.append(processed)
-                self.processed_count += 1
+        results = [item.upper() for item in map(str.strip, items) if item]
+        self.processed_count += len(results)
         return results
     
     def save_results(self, results: List[str], output_path: str) -> None:
         """Save processed results to file."""
         with open(output_path, 'w') as f:
-            for result in results:
-                f.write(f"{result}\n")
+            f.writelines(map("{}\n".format, results))
     
     def get_stats(self) -> Dict:
         """Get processing statistics."""
@@ -54,7 +53,7 @@ class DataProcessor:
     
     def validate_data(self, items: List[str]) -> bool:
         """Validate input data before processing."""
-        return all(isinstance(item, str) for item in items)
+        return all(map(str.__instancecheck__, items))
 
 if __name__ == "__main__":
     processor = DataProcessor("config.json")
@@ -10,6 +10,8 @@ from typing import Optional, Dict, Any
 class Car:
     """Car class with standard vehicle operations."""
     
+    __slots__ = ("make", "model", "year", "mileage", "fuel_level", "is_running", "maintenance_due")
+    
     def __init__(self, make: str, model: str, year: int):
         self.make = make
         self.model = model
@@ -67,6 +69,10 @@ class Car:
 class Motorcycle:
     """Motorcycle class with similar operations to Car."""
     
+    __slots__ = (
+        "make", "model", "year", "engine_size", "mileage", "fuel_level", "is_running", "maintenance_due"
+    )
+    
     def __init__(self, make: str, model: str, year: int, engine_size: int):
         self.make = make
         self.model = model
@@ -126,6 +132,11 @@ class Motorcycle:
 class Truck:
     """Truck class with cargo-specific operations."""
     
+    __slots__ = (
+        "make", "model", "year", "max_cargo", "current_cargo",
+        "mileage", "fuel_level", "is_running", "maintenance_due"
+    )
+    
     def __init__(self, make: str, model: str, year: int, max_cargo: float):
         self.make = make
         self.model = model
@@ -204,6 +215,11 @@ class Truck:
 class ElectricCar:
     """Electric car with battery-specific operations."""
     
+    __slots__ = (
+        "make", "model", "year", "battery_capacity", "battery_level",
+        "mileage", "is_running", "maintenance_due"
+    )
+    
     def __init__(self, make: str, model: str, year: int, battery_capacity: float):
         self.make = make
         self.model = model